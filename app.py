@@ -1,16 +1,90 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Depends, Request, BackgroundTasks
+from fastapi.responses import PlainTextResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, List, Any, Optional, Union
-import json
+from pydantic import BaseModel, ConfigDict, ValidationError
+from typing import Dict, List, Any, Optional, Union, Literal
+from functools import lru_cache
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+import asyncio
 import shutil
-import tempfile
-import subprocess
+import signal
 import os
+import time
 import uuid
 
-app = FastAPI(title="HugeGraph Loader API")
+import aiofiles
+import orjson
+
+
+def sweep_job_root():
+    """
+    Remove job directories under JOB_ROOT last active more than JOB_MAX_AGE_SECONDS ago.
+    
+    A finished job is aged from its finished marker. A running job's marker is
+    refreshed every JOB_HEARTBEAT_INTERVAL_SECONDS, so it only ages once its
+    worker has died without marking it finished.
+    """
+    cutoff = time.time() - JOB_MAX_AGE_SECONDS
+    try:
+        job_dirs = list(JOB_ROOT.iterdir())
+    except FileNotFoundError:
+        return
+    
+    for job_dir in job_dirs:
+        try:
+            for marker in (JOB_FINISHED_MARKER, JOB_RUNNING_MARKER):
+                try:
+                    last_active = (job_dir / marker).stat().st_mtime
+                    break
+                except FileNotFoundError:
+                    continue
+            else:
+                # Not created by a job (or created before markers existed)
+                last_active = job_dir.stat().st_mtime
+            if last_active < cutoff:
+                shutil.rmtree(job_dir, ignore_errors=True)
+        except FileNotFoundError:
+            # Already removed by another sweep
+            continue
+
+
+def mark_job_finished(job_dir):
+    """Replace a job's running marker with a finished marker, timestamped now."""
+    running_marker = job_dir / JOB_RUNNING_MARKER
+    if running_marker.exists():
+        (job_dir / JOB_FINISHED_MARKER).touch()
+        running_marker.unlink()
+
+
+async def keep_job_running(job_dir):
+    """Refresh a job's running marker until cancelled."""
+    running_marker = job_dir / JOB_RUNNING_MARKER
+    while True:
+        await asyncio.sleep(JOB_HEARTBEAT_INTERVAL_SECONDS)
+        try:
+            os.utime(running_marker)
+        except FileNotFoundError:
+            return
+
+
+async def sweep_job_root_periodically():
+    """Sweep stale job directories, e.g. those left behind by failed requests."""
+    while True:
+        await asyncio.to_thread(sweep_job_root)
+        await asyncio.sleep(JOB_SWEEP_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    JOB_ROOT.mkdir(parents=True, exist_ok=True)
+    sweeper = asyncio.create_task(sweep_job_root_periodically())
+    yield
+    sweeper.cancel()
+
+
+app = FastAPI(title="HugeGraph Loader API", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -27,6 +101,27 @@ HUGEGRAPH_HOST = "localhost"
 HUGEGRAPH_PORT = "8080"
 HUGEGRAPH_GRAPH = "hugegraph"
 
+# Per-job working directories are created under this root
+JOB_ROOT = Path("/var/tmp/hugegraph-jobs")
+# Job directories (including loader logs) older than this are removed by the
+# periodic sweep
+JOB_MAX_AGE_SECONDS = 60 * 60
+JOB_SWEEP_INTERVAL_SECONDS = 10 * 60
+# Marker files in a job directory. The running marker is refreshed every
+# JOB_HEARTBEAT_INTERVAL_SECONDS while the job is alive; the sweep ages a job
+# from its finished marker, or from its last heartbeat if its worker died
+JOB_RUNNING_MARKER = ".running"
+JOB_FINISHED_MARKER = ".finished"
+JOB_HEARTBEAT_INTERVAL_SECONDS = 60
+
+# Chunk size used when streaming uploaded files to disk; each read/write is a
+# thread pool round trip, so large chunks keep multi-MB uploads cheap
+UPLOAD_CHUNK_SIZE = 4 << 20  # 4 MiB
+
+# Only the tail of the loader output is returned inline; full logs are
+# available from /api/jobs/{job_id}/logs
+LOG_TAIL_BYTES = 64 * 1024
+
 # Schema Models
 class PropertyKey(BaseModel):
     name: str
@@ -59,6 +154,25 @@ class SchemaDefinition(BaseModel):
     vertex_labels: List[VertexLabel]
     edge_labels: List[EdgeLabel]
 
+# Loader config models (struct.json). Only the fields the API rewrites are
+# declared; everything else is passed through to the loader unchanged
+class InputSource(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    
+    type: Optional[str] = None  # file, hdfs, jdbc, etc.
+    path: Optional[str] = None
+
+class InputMapping(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    
+    input: Optional[InputSource] = None
+
+class LoaderConfig(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    
+    vertices: Optional[List[InputMapping]] = None
+    edges: Optional[List[InputMapping]] = None
+
 class HugeGraphLoadResponse(BaseModel):
     job_id: str
     status: str
@@ -67,118 +181,157 @@ class HugeGraphLoadResponse(BaseModel):
     schema_groovy: Optional[str] = None
 
 
-def json_to_groovy(schema_json: Union[Dict, SchemaDefinition]) -> str:
+def json_to_groovy(schema_json: Union[str, bytes, Dict, SchemaDefinition]) -> str:
     """
     Convert JSON schema definition to HugeGraph Groovy schema format.
     
+    Conversions of JSON input are cached, so resubmitting the same schema
+    does not redo the validation and transformation.
+    
     Args:
-        schema_json: The schema definition in JSON format or as a SchemaDefinition object
+        schema_json: The schema definition as a raw JSON string/bytes, a dictionary
+            or a SchemaDefinition object
         
     Returns:
         The equivalent schema in Groovy format
     """
-    if isinstance(schema_json, dict):
-        schema = SchemaDefinition(**schema_json)
+    if isinstance(schema_json, SchemaDefinition):
+        return _render_groovy(schema_json)
+    
+    # Normalize to bytes to use as the cache key
+    if isinstance(schema_json, str):
+        schema_bytes = schema_json.encode()
+    elif isinstance(schema_json, dict):
+        # Keys are not sorted: the bytes are also what gets rendered, and
+        # options must keep their insertion order
+        schema_bytes = orjson.dumps(schema_json)
     else:
-        schema = schema_json
+        schema_bytes = schema_json
     
+    return _json_to_groovy_cached(schema_bytes)
+
+
+@lru_cache(maxsize=256)
+def _json_to_groovy_cached(schema_bytes: bytes) -> str:
+    """Parse, validate and convert a JSON schema; results are memoized per input."""
+    return _render_groovy(SchemaDefinition.model_validate_json(schema_bytes))
+
+
+# Precomputed Groovy fragments for the known property types and ID strategies
+_PROPERTY_TYPE_GROOVY = {
+    prop_type: f".as{prop_type.capitalize()}()"
+    for prop_type in (
+        "text", "int", "long", "float", "double", "boolean",
+        "byte", "date", "uuid", "blob",
+    )
+}
+
+_ID_STRATEGY_GROOVY = {
+    "primary_key": ".useCustomizeStringId()",  # This will be overridden by primaryKeys
+    "customize_number": ".useCustomizeNumberId()",
+    "customize_string": ".useCustomizeStringId()",
+    "automatic": ".useAutomaticId()",
+}
+
+
+def _render_options(options: Dict[str, Any]) -> str:
+    """Render an options dictionary as chained Groovy method calls."""
+    return ''.join(
+        f'.{opt_name}("{opt_value}")' if isinstance(opt_value, str) else f'.{opt_name}({opt_value})'
+        for opt_name, opt_value in options.items()
+    )
+
+
+def _render_groovy(schema: SchemaDefinition) -> str:
+    """Render a validated schema definition as Groovy."""
     groovy_lines = []
+    append_line = groovy_lines.append
     
     # Process property keys
     for prop in schema.property_keys:
-        line = f'schema.propertyKey("{prop.name}").as{prop.type.capitalize()}()'
+        as_type = _PROPERTY_TYPE_GROOVY.get(prop.type)
+        if as_type is None:
+            as_type = f".as{prop.type.capitalize()}()"
+        
+        parts = ['schema.propertyKey("', prop.name, '")', as_type]
         
         if prop.cardinality:
-            line += f'.cardinality("{prop.cardinality}")'
+            parts.append(f'.cardinality("{prop.cardinality}")')
         
         # Add any additional options from the options dictionary
         if prop.options:
-            for opt_name, opt_value in prop.options.items():
-                if isinstance(opt_value, str):
-                    line += f'.{opt_name}("{opt_value}")'
-                else:
-                    line += f'.{opt_name}({opt_value})'
+            parts.append(_render_options(prop.options))
         
-        line += '.ifNotExist().create();'
-        groovy_lines.append(line)
+        parts.append('.ifNotExist().create();')
+        append_line(''.join(parts))
     
-    groovy_lines.append("")  # Empty line for readability
+    append_line("")  # Empty line for readability
     
     # Process vertex labels
     for vertex in schema.vertex_labels:
-        line = f'schema.vertexLabel("{vertex.name}")'
+        parts = ['schema.vertexLabel("', vertex.name, '")']
         
         # Add ID strategy if defined
-        if vertex.id_strategy:
-            if vertex.id_strategy == "primary_key":
-                line += '.useCustomizeStringId()'  # This will be overridden by primaryKeys
-            elif vertex.id_strategy == "customize_number":
-                line += '.useCustomizeNumberId()'
-            elif vertex.id_strategy == "customize_string":
-                line += '.useCustomizeStringId()'
-            elif vertex.id_strategy == "automatic":
-                line += '.useAutomaticId()'
+        if vertex.id_strategy in _ID_STRATEGY_GROOVY:
+            parts.append(_ID_STRATEGY_GROOVY[vertex.id_strategy])
         
         # Add properties
         if vertex.properties:
             props_str = ', '.join([f'"{prop}"' for prop in vertex.properties])
-            line += f'.properties({props_str})'
+            parts.append(f'.properties({props_str})')
         
         # Add primary keys
         if vertex.primary_keys:
             keys_str = ', '.join([f'"{key}"' for key in vertex.primary_keys])
-            line += f'.primaryKeys({keys_str})'
+            parts.append(f'.primaryKeys({keys_str})')
         
         # Add nullable keys
         if vertex.nullable_keys:
             keys_str = ', '.join([f'"{key}"' for key in vertex.nullable_keys])
-            line += f'.nullableKeys({keys_str})'
+            parts.append(f'.nullableKeys({keys_str})')
         
         # Add any additional options
         if vertex.options:
-            for opt_name, opt_value in vertex.options.items():
-                if isinstance(opt_value, str):
-                    line += f'.{opt_name}("{opt_value}")'
-                else:
-                    line += f'.{opt_name}({opt_value})'
+            parts.append(_render_options(vertex.options))
         
-        line += '.ifNotExist().create();'
-        groovy_lines.append(line)
+        parts.append('.ifNotExist().create();')
+        append_line(''.join(parts))
     
-    groovy_lines.append("")  # Empty line for readability
+    append_line("")  # Empty line for readability
     
     # Process edge labels
     for edge in schema.edge_labels:
-        line = f'schema.edgeLabel("{edge.name}")'
-        line += f'.sourceLabel("{edge.source_label}")'
-        line += f'.targetLabel("{edge.target_label}")'
+        parts = [
+            'schema.edgeLabel("', edge.name, '")',
+            '.sourceLabel("', edge.source_label, '")',
+            '.targetLabel("', edge.target_label, '")',
+        ]
         
         # Add properties
         if edge.properties:
             props_str = ', '.join([f'"{prop}"' for prop in edge.properties])
-            line += f'.properties({props_str})'
+            parts.append(f'.properties({props_str})')
         
         # Add sort keys
         if edge.sort_keys:
             keys_str = ', '.join([f'"{key}"' for key in edge.sort_keys])
-            line += f'.sortKeys({keys_str})'
+            parts.append(f'.sortKeys({keys_str})')
         
         # Add any additional options
         if edge.options:
-            for opt_name, opt_value in edge.options.items():
-                if isinstance(opt_value, str):
-                    line += f'.{opt_name}("{opt_value}")'
-                else:
-                    line += f'.{opt_name}({opt_value})'
+            parts.append(_render_options(edge.options))
         
-        line += '.ifNotExist().create();'
-        groovy_lines.append(line)
+        parts.append('.ifNotExist().create();')
+        append_line(''.join(parts))
     
     return '\n'.join(groovy_lines)
 
 
+# No custom response_class: with a response_model FastAPI serializes the
+# response (including large loader output) straight to JSON bytes via Pydantic
 @app.post("/api/load", response_model=HugeGraphLoadResponse)
 async def load_data(
+    background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
     config: str = Form(...),
     schema_json: Optional[str] = Form(None),
@@ -190,146 +343,267 @@ async def load_data(
     - config: JSON configuration similar to struct.json
     - schema_json: Optional schema in JSON format that will be converted to Groovy
     """
+    # Uploads are saved concurrently under their filenames, so two files with
+    # the same name would be written to the same path at once
+    filename_counts = Counter(file.filename for file in files)
+    duplicates = sorted(name for name, count in filename_counts.items() if count > 1)
+    if duplicates:
+        raise HTTPException(status_code=400, detail=f"Duplicate filenames in upload: {', '.join(duplicates)}")
+    
     # Generate a unique job ID
     job_id = str(uuid.uuid4())
+    job_dir = JOB_ROOT / job_id
+    heartbeat = None
     
     try:
-        # Parse the config
-        config_data = json.loads(config)
+        # Parse and validate the config
+        config_data = LoaderConfig.model_validate_json(config)
+        
+        # Create a working directory for this job. Its input files are removed
+        # in the background once the response has been sent, the loader logs
+        # are kept until the periodic sweep
+        tmpdir = job_dir / "input"
+        tmpdir.mkdir(parents=True)
+        (job_dir / JOB_RUNNING_MARKER).touch()
+        heartbeat = asyncio.create_task(keep_job_running(job_dir))
+        background_tasks.add_task(shutil.rmtree, tmpdir, ignore_errors=True)
         
-        # Create a temporary directory for this job
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Dictionary to map original filenames to their paths in the temp directory
-            file_mapping = {}
-            
-            # Save all uploaded files to temp directory
-            for file in files:
-                file_path = os.path.join(tmpdir, file.filename)
-                with open(file_path, "wb") as f:
-                    shutil.copyfileobj(file.file, f)
-                file_mapping[file.filename] = file_path
-            
-            # Convert JSON schema to Groovy if provided
-            schema_path = None
-            schema_groovy = None
-            if schema_json:
-                schema_data = json.loads(schema_json)
-                schema_groovy = json_to_groovy(schema_data)
-                schema_path = os.path.join(tmpdir, f"schema-{job_id}.groovy")
-                with open(schema_path, "w") as f:
-                    f.write(schema_groovy)
-            
-            # Update the paths in the config to point to the temp files
-            updated_config = update_file_paths_in_config(config_data, file_mapping)
-            
-            # Save the updated config to a file
-            config_path = os.path.join(tmpdir, f"struct-{job_id}.json")
-            with open(config_path, "w") as f:
-                json.dump(updated_config, f, indent=2)
-            
-            # Build the HugeGraph loader command
-            cmd = [
-                "sh", HUGEGRAPH_LOADER_PATH,
-                "-g", HUGEGRAPH_GRAPH,
-                "-f", config_path,
-                "-h", HUGEGRAPH_HOST,
-                "-p", HUGEGRAPH_PORT
-            ]
-            
-            if schema_path:
-                cmd.extend(["-s", schema_path])
-            
-            # Run the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                return HugeGraphLoadResponse(
-                    job_id=job_id,
-                    status="error",
-                    message=f"HugeGraph loader failed with exit code {result.returncode}",
-                    details={
-                        "stdout": result.stdout,
-                        "stderr": result.stderr
-                    },
-                    schema_groovy=schema_groovy
-                )
-            
+        async def save(file: UploadFile):
+            file_path = os.path.join(tmpdir, file.filename)
+            # Stream in chunks so the event loop is free between reads/writes
+            async with aiofiles.open(file_path, "wb") as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
+            return file.filename, file_path
+        
+        # Save all uploaded files to temp directory concurrently and map the
+        # original filenames to their paths in the temp directory
+        file_mapping = dict(await asyncio.gather(*(save(file) for file in files)))
+        
+        # Convert JSON schema to Groovy if provided
+        schema_path = None
+        schema_groovy = None
+        if schema_json:
+            schema_groovy = json_to_groovy(schema_json)
+            schema_path = os.path.join(tmpdir, f"schema-{job_id}.groovy")
+            with open(schema_path, "w") as f:
+                f.write(schema_groovy)
+        
+        # Update the paths in the config to point to the temp files
+        updated_config = update_file_paths_in_config(config_data, file_mapping)
+        
+        # Save the updated config to a file
+        config_path = os.path.join(tmpdir, f"struct-{job_id}.json")
+        # The loader only accepts a regular file for -f (not /dev/stdin), so
+        # the config is written once, compactly, in a single call
+        with open(config_path, "w") as f:
+            f.write(updated_config.model_dump_json(exclude_unset=True))
+        
+        # Build the HugeGraph loader command
+        cmd = [
+            "sh", HUGEGRAPH_LOADER_PATH,
+            "-g", HUGEGRAPH_GRAPH,
+            "-f", config_path,
+            "-h", HUGEGRAPH_HOST,
+            "-p", HUGEGRAPH_PORT
+        ]
+        
+        if schema_path:
+            cmd.extend(["-s", schema_path])
+        
+        # Run the command without blocking the event loop, streaming its
+        # output to log files instead of buffering it in memory
+        stdout_path = job_dir / "stdout.log"
+        stderr_path = job_dir / "stderr.log"
+        with open(stdout_path, "wb") as stdout_file, open(stderr_path, "wb") as stderr_file:
+            # Start the loader in its own process group so the whole tree
+            # (sh and the JVM it starts) can be killed together
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=stdout_file,
+                stderr=stderr_file,
+                start_new_session=True
+            )
+            try:
+                await proc.wait()
+            except asyncio.CancelledError:
+                # The job is marked finished below, so don't leave the loader
+                # running against inputs the sweep may then remove
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                raise
+        
+        if proc.returncode != 0:
             return HugeGraphLoadResponse(
                 job_id=job_id,
-                status="success",
-                message="Data loaded successfully",
+                status="error",
+                message=f"HugeGraph loader failed with exit code {proc.returncode}",
                 details={
-                    "stdout": result.stdout
+                    "stdout": read_log_tail(stdout_path),
+                    "stderr": read_log_tail(stderr_path)
                 },
                 schema_groovy=schema_groovy
             )
-            
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
+        
+        return HugeGraphLoadResponse(
+            job_id=job_id,
+            status="success",
+            message="Data loaded successfully",
+            details={
+                "stdout": read_log_tail(stdout_path)
+            },
+            schema_groovy=schema_groovy
+        )
+        
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}")
+    finally:
+        if heartbeat is not None:
+            heartbeat.cancel()
+        mark_job_finished(job_dir)
 
 
-def update_file_paths_in_config(config, file_mapping):
+def update_file_paths_in_config(config: LoaderConfig, file_mapping: Dict[str, str]) -> LoaderConfig:
     """
     Update file paths in the config to use the temporary file paths.
     
+    The original config is not modified. Only the items whose path is
+    rewritten (and their inputs) are copied; everything else is shared with
+    the original config.
+    
     Args:
-        config: The configuration dictionary
+        config: The validated loader configuration
         file_mapping: Dictionary mapping original filenames to temp file paths
     
     Returns:
-        Updated configuration dictionary
+        Updated configuration
     """
-    # Create a deep copy of the config to avoid modifying the original
-    updated_config = json.loads(json.dumps(config))
+    # Bind the lookups used once per item to locals; file_mapping is keyed on
+    # the uploaded filenames, so the basename can be looked up directly
+    get_path = file_mapping.get
+    basename = os.path.basename
     
     # Function to process vertices and edges
     def update_paths(items):
+        updated_items = []
+        append = updated_items.append
         for item in items:
-            if "input" in item and item["input"].get("type") == "file":
-                # Extract just the filename from the path
-                original_path = item["input"]["path"]
-                filename = os.path.basename(original_path)
-                
-                # Check if this filename exists in our mapping
-                if filename in file_mapping:
-                    item["input"]["path"] = file_mapping[filename]
-                # Otherwise, keep the original path (might be a relative path or a URL)
+            source = item.input
+            if source is not None and source.type == "file" and source.path:
+                # Look up the file by name, otherwise keep the original path
+                # (might be a relative path or a URL)
+                new_path = get_path(basename(source.path))
+                if new_path is not None:
+                    source = source.model_copy(update={"path": new_path})
+                    item = item.model_copy(update={"input": source})
+            append(item)
         
-        return items
+        return updated_items
     
     # Update paths in vertices and edges
-    if "vertices" in updated_config:
-        updated_config["vertices"] = update_paths(updated_config["vertices"])
+    updates = {}
+    if config.vertices:
+        updates["vertices"] = update_paths(config.vertices)
+    
+    if config.edges:
+        updates["edges"] = update_paths(config.edges)
+    
+    return config.model_copy(update=updates)
+
+
+def read_log_tail(log_path, limit=LOG_TAIL_BYTES):
+    """
+    Read the end of a loader log file.
     
-    if "edges" in updated_config:
-        updated_config["edges"] = update_paths(updated_config["edges"])
+    Args:
+        log_path: Path to the log file
+        limit: Maximum number of bytes to read from the end of the file
     
-    return updated_config
+    Returns:
+        The last `limit` bytes of the log, decoded as text
+    """
+    with open(log_path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(size - limit, 0))
+        return f.read().decode(errors="replace")
 
 
-@app.post("/api/convert-schema", response_class=JSONResponse)
-async def convert_schema(schema_json: Dict = None):
+# /api/convert-schema reads its body raw, so its schema is documented by hand.
+# Nested models are referenced from the OpenAPI components, where they are
+# added together with SchemaDefinition itself
+_SCHEMA_DEFINITION_JSON_SCHEMA = SchemaDefinition.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_SCHEMA_DEFINITION_DEFS = _SCHEMA_DEFINITION_JSON_SCHEMA.pop("$defs", {})
+
+_default_openapi = app.openapi
+
+
+def openapi():
+    """Generate the OpenAPI schema, including the convert-schema body models."""
+    if app.openapi_schema is None:
+        components = _default_openapi().setdefault("components", {})
+        schemas = components.setdefault("schemas", {})
+        schemas.update(_SCHEMA_DEFINITION_DEFS)
+        schemas["SchemaDefinition"] = _SCHEMA_DEFINITION_JSON_SCHEMA
+    return app.openapi_schema
+
+
+app.openapi = openapi
+
+
+@app.post(
+    "/api/convert-schema",
+    response_class=PlainTextResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": {"$ref": "#/components/schemas/SchemaDefinition"}}
+            },
+            "required": True,
+        }
+    },
+)
+async def convert_schema(request: Request):
     """
     Convert JSON schema to Groovy format without loading data.
     
     Args:
-        schema_json: The schema definition in JSON format
+        request: Request whose body is the schema definition in JSON format
         
     Returns:
-        The equivalent schema in Groovy format
+        The equivalent schema in Groovy format, as the plain-text response body
     """
     try:
-        groovy_schema = json_to_groovy(schema_json)
-        return {
-            "status": "success",
-            "schema_groovy": groovy_schema
-        }
+        # Read the raw body so the schema is parsed only once, by Pydantic
+        schema_json = await request.body()
+        return json_to_groovy(schema_json)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error converting schema: {str(e)}")
 
 
+@app.get("/api/jobs/{job_id}/logs", response_class=FileResponse)
+async def get_job_logs(job_id: uuid.UUID, stream: Literal["stdout", "stderr"] = "stdout"):
+    """
+    Retrieve the full HugeGraph loader output of a job.
+    
+    Args:
+        job_id: The job ID returned by /api/load
+        stream: Which output stream to return, stdout or stderr
+        
+    Returns:
+        The log file as plain text
+    """
+    log_path = JOB_ROOT / str(job_id) / f"{stream}.log"
+    if not log_path.is_file():
+        raise HTTPException(status_code=404, detail=f"No {stream} log found for job {job_id}")
+    return FileResponse(log_path, media_type="text/plain")
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
@@ -338,4 +612,13 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Workers need the app as an import string. Job directories are keyed by
+    # UUID under JOB_ROOT, so concurrent workers do not collide
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count() or 1,
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file